@@ -4,6 +4,10 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from collections import deque
+from itertools import islice
+
+PAGE_LINES = 10
+LINE_WIDTH = 50
 
 class Node:
     def __init__(self, key):
@@ -141,22 +145,64 @@ class AVLTree:
         self._postorder(node.right, res)
         res.append(node.key)
 
+    # Travessias preguiçosas: pilha explícita, memória O(altura)
+    def iter_inorder(self):
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def iter_preorder(self):
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        stack = []
+        last = None
+        node = self.root
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right and last is not top.right:
+                node = top.right
+            else:
+                yield top.key
+                last = stack.pop()
+
+    def iter_level(self, lvl):
+        stack = [(self.root, 0)] if self.root else []
+        while stack:
+            node, depth = stack.pop()
+            if depth == lvl:
+                yield node.key
+                continue
+            if node.right:
+                stack.append((node.right, depth+1))
+            if node.left:
+                stack.append((node.left, depth+1))
+
+    def iter_levels(self):
+        for lvl in range(self.height(self.root)):
+            yield lvl, self.iter_level(lvl)
+
     def to_levels_text(self):
         if not self.root:
             return "<árvore vazia>"
-        q = deque([(self.root, 0)])
-        levels = {}
-        while q:
-            node, lvl = q.popleft()
-            levels.setdefault(lvl, []).append(str(node.key))
-            if node.left:
-                q.append((node.left, lvl+1))
-            if node.right:
-                q.append((node.right, lvl+1))
-        lines = []
-        for lvl in sorted(levels.keys()):
-            lines.append(f"Nivel {lvl}: " + " ".join(levels[lvl]))
-        return "\n".join(lines)
+        return "\n".join(levels_lines(self, width=None))
 
     def to_networkx(self):
         G = nx.DiGraph()
@@ -176,6 +222,104 @@ class AVLTree:
                 q.append(node.right)
         return G
 
+# Quebra as chaves em linhas de até `width` caracteres (uma linha por tela);
+# com width=None tudo sai em uma única linha
+def chunk_lines(keys, prefix="", width=LINE_WIDTH):
+    line = prefix
+    for key in keys:
+        tok = str(key)
+        if width is not None and line != prefix and len(line) + 1 + len(tok) > width:
+            yield line
+            line = prefix
+        line += (" " if line != prefix else "") + tok
+    if line != prefix:
+        yield line
+
+def level_prefix(lvl):
+    return f"Nivel {lvl}: "
+
+def levels_lines(tree, width=LINE_WIDTH):
+    for lvl, keys in tree.iter_levels():
+        yield from chunk_lines(keys, level_prefix(lvl), width)
+
+def parse_key(txt):
+    try:
+        return int(txt)
+    except ValueError:
+        try:
+            return float(txt)
+        except ValueError:
+            return None
+
+# Compara como a árvore compara (3 e 3.0 são a mesma chave, inteiros grandes
+# sem perder precisão)
+def line_has_key(line, key):
+    keys = line.split(": ", 1)[-1].split()
+    return any(parse_key(tok) == key for tok in keys)
+
+# Mostra no tk.Text só a página visível; `source` devolve um iterador novo de
+# linhas a cada chamada, então o texto completo nunca é montado. O iterador
+# em uso fica guardado, e avançar de página só lê as linhas seguintes.
+class PagedOutput:
+    def __init__(self, text, status, page_lines=PAGE_LINES):
+        self.text = text
+        self.status = status
+        self.page_lines = page_lines
+        self.title = ""
+        self.source = lambda: iter(())
+        self.offset = 0
+        self._it = None
+        self._next = 0
+
+    def show(self, title, source):
+        self.title = title
+        self.source = source
+        self._it = None
+        self.goto_line(0)
+
+    def _page(self, offset):
+        # Só volta ao início quando a linha pedida já ficou para trás
+        if self._it is None or offset < self._next:
+            self._it = self.source()
+            self._next = 0
+        self._next += sum(1 for _ in islice(self._it, offset - self._next))
+        lines = list(islice(self._it, self.page_lines))
+        self._next += len(lines)
+        return lines
+
+    def _render(self, offset, lines):
+        self.offset = offset
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, "\n".join(lines) if lines else "<árvore vazia>")
+        if lines:
+            self.status.config(text=f"{self.title} - linhas {offset + 1}-{offset + len(lines)}")
+        else:
+            self.status.config(text=f"{self.title} - 0 linhas")
+
+    def goto_line(self, offset):
+        offset = max(0, offset)
+        self._render(offset, self._page(offset))
+
+    def next_page(self):
+        offset = self.offset + self.page_lines
+        lines = self._page(offset)
+        if lines:
+            self._render(offset, lines)
+
+    def prev_page(self):
+        self.goto_line(self.offset - self.page_lines)
+
+    # A linha encontrada vira a primeira da página, lida do mesmo iterador
+    def find(self, predicate):
+        it = self.source()
+        for i, line in enumerate(it):
+            if predicate(line):
+                lines = [line] + list(islice(it, self.page_lines - 1))
+                self._it, self._next = it, i + len(lines)
+                self._render(i, lines)
+                return True
+        return False
+
 class TreeGUI:
     def __init__(self, root):
         self.tree = AVLTree()
@@ -205,8 +349,24 @@ class TreeGUI:
         self.draw_btn = ttk.Button(frm, text="Desenhar árvore", command=self.draw_tree_window)
         self.draw_btn.grid(row=2, column=2, pady=(8,0))
 
-        self.output = tk.Text(frm, width=50, height=10)
+        self.output = tk.Text(frm, width=LINE_WIDTH, height=PAGE_LINES, wrap="none")
         self.output.grid(row=3, column=0, columnspan=3, pady=(8,0))
+        self.xscroll = ttk.Scrollbar(frm, orient="horizontal", command=self.output.xview)
+        self.xscroll.grid(row=4, column=0, columnspan=3, sticky="ew")
+        self.output.config(xscrollcommand=self.xscroll.set)
+
+        self.status = ttk.Label(frm, text="")
+        self.status.grid(row=5, column=0, columnspan=3, pady=(4,0), sticky="w")
+        self.pager = PagedOutput(self.output, self.status)
+
+        self.prev_btn = ttk.Button(frm, text="< Página", command=self.pager.prev_page)
+        self.prev_btn.grid(row=6, column=0, pady=(8,0))
+        self.next_btn = ttk.Button(frm, text="Página >", command=self.pager.next_page)
+        self.next_btn.grid(row=6, column=1, pady=(8,0))
+        self.goto_level_btn = ttk.Button(frm, text="Ir p/ nível", command=self.on_goto_level)
+        self.goto_level_btn.grid(row=7, column=0, pady=(8,0))
+        self.goto_key_btn = ttk.Button(frm, text="Ir p/ chave", command=self.on_goto_key)
+        self.goto_key_btn.grid(row=7, column=1, pady=(8,0))
 
         self.fig = None
         self.canvas = None
@@ -215,15 +375,7 @@ class TreeGUI:
         txt = self.entry.get().strip()
         if not txt:
             return None
-        try:
-            key = int(txt)
-            return key
-        except ValueError:
-            try:
-                key = float(txt)
-                return key
-            except ValueError:
-                return None
+        return parse_key(txt)
 
     def on_insert(self):
         key = self._read_key()
@@ -232,7 +384,7 @@ class TreeGUI:
             return
         self.tree.insert(key)
         self.entry.delete(0, tk.END)
-        self.show_textual(auto=True)
+        self.show_textual()
 
     def on_delete(self):
         key = self._read_key()
@@ -241,30 +393,38 @@ class TreeGUI:
             return
         self.tree.delete(key)
         self.entry.delete(0, tk.END)
-        self.show_textual(auto=True)
+        self.show_textual()
 
     def show_inorder(self):
-        res = self.tree.inorder()
-        self._set_output("Em Ordem: " + " ".join(map(str,res)))
+        self.pager.show("Em Ordem", lambda: chunk_lines(self.tree.iter_inorder()))
 
     def show_preorder(self):
-        res = self.tree.preorder()
-        self._set_output("Pre Ordem: " + " ".join(map(str,res)))
+        self.pager.show("Pre Ordem", lambda: chunk_lines(self.tree.iter_preorder()))
 
     def show_postorder(self):
-        res = self.tree.postorder()
-        self._set_output("Pos Ordem: " + " ".join(map(str,res)))
+        self.pager.show("Pos Ordem", lambda: chunk_lines(self.tree.iter_postorder()))
 
-    def show_textual(self, auto=False):
-        txt = self.tree.to_levels_text()
-        if auto:
-            self._set_output(txt)
-        else:
-            self._set_output(txt)
+    def show_textual(self):
+        self.pager.show("Níveis", lambda: levels_lines(self.tree))
 
-    def _set_output(self, text):
-        self.output.delete("1.0", tk.END)
-        self.output.insert(tk.END, text)
+    def on_goto_level(self):
+        lvl = self._read_key()
+        if not isinstance(lvl, int) or lvl < 0:
+            messagebox.showwarning("Valor inválido", "Digite um nível inteiro não negativo.")
+            return
+        if self.pager.title != "Níveis":
+            self.show_textual()
+        prefix = level_prefix(lvl)
+        if not self.pager.find(lambda line: line.startswith(prefix)):
+            messagebox.showinfo("Ir p/ nível", f"Nível {lvl} não existe.")
+
+    def on_goto_key(self):
+        key = self._read_key()
+        if key is None:
+            messagebox.showwarning("Valor inválido", "Digite um número válido (int ou float).")
+            return
+        if not self.pager.find(lambda line: line_has_key(line, key)):
+            messagebox.showinfo("Ir p/ chave", f"Chave {key} não encontrada.")
 
     def draw_tree_window(self):
         win = tk.Toplevel(self.root)
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+# O módulo da árvore importa networkx e matplotlib no topo; sem as dependências
+# da interface gráfica instaladas, estes testes são pulados
+pytest.importorskip("networkx")
+pytest.importorskip("matplotlib")
+
+from arvoreEstruturaDeDados import (
+    AVLTree, PagedOutput, chunk_lines, level_prefix, levels_lines, line_has_key,
+)
+
+
+class FakeText:
+    def __init__(self):
+        self.content = ""
+
+    def delete(self, *args):
+        self.content = ""
+
+    def insert(self, index, text):
+        self.content += text
+
+    def config(self, **kwargs):
+        self.options = kwargs
+
+
+def random_tree(n=500, seed=0):
+    rnd = random.Random(seed)
+    keys = rnd.sample(range(10 * n), n)
+    tree = AVLTree()
+    for k in keys:
+        tree.insert(k)
+    for k in keys[: n // 5]:
+        tree.delete(k)
+    return tree
+
+
+def test_iterators_match_list_traversals():
+    for seed in range(5):
+        tree = random_tree(seed=seed)
+        assert list(tree.iter_inorder()) == tree.inorder()
+        assert list(tree.iter_preorder()) == tree.preorder()
+        assert list(tree.iter_postorder()) == tree.postorder()
+
+
+def test_iterators_on_empty_tree():
+    tree = AVLTree()
+    assert list(tree.iter_inorder()) == []
+    assert list(tree.iter_preorder()) == []
+    assert list(tree.iter_postorder()) == []
+    assert list(tree.iter_levels()) == []
+    assert tree.to_levels_text() == "<árvore vazia>"
+
+
+def test_empty_source_reports_zero_lines():
+    text, status = FakeText(), FakeText()
+    pager = PagedOutput(text, status)
+    assert not pager.find(lambda line: True)
+    pager.show("Níveis", lambda: levels_lines(AVLTree()))
+    assert text.content == "<árvore vazia>"
+    assert status.options["text"] == "Níveis - 0 linhas"
+
+
+def test_iter_levels_covers_every_key_once():
+    tree = random_tree()
+    seen = [k for _, keys in tree.iter_levels() for k in keys]
+    assert sorted(seen) == tree.inorder()
+
+
+def test_chunk_lines_respects_width():
+    keys = list(range(1000, 1200))
+    lines = list(chunk_lines(keys, "Nivel 3: ", 50))
+    assert all(len(line) <= 50 for line in lines)
+    assert [int(t) for line in lines for t in line.split(": ")[1].split()] == keys
+    assert list(chunk_lines(keys[:3], "", None)) == ["1000 1001 1002"]
+
+
+def make_pager(tree, page_lines=10):
+    text, status = FakeText(), FakeText()
+    pager = PagedOutput(text, status, page_lines)
+    pager.show("Níveis", lambda: levels_lines(tree))
+    return pager, text
+
+
+def test_paging_stays_in_range():
+    tree = random_tree()
+    lines = list(levels_lines(tree))
+    pager, text = make_pager(tree)
+    assert text.content.splitlines() == lines[:10]
+    pager.prev_page()
+    assert pager.offset == 0
+    for _ in range(len(lines)):
+        pager.next_page()
+    assert text.content.splitlines() == lines[pager.offset:]
+    assert 0 < len(lines) - pager.offset <= 10
+
+
+def test_find_puts_match_on_first_line():
+    tree = random_tree()
+    pager, text = make_pager(tree)
+    prefix = level_prefix(6)
+    assert pager.find(lambda line: line.startswith(prefix))
+    assert text.content.splitlines()[0].startswith(prefix)
+    assert not pager.find(lambda line: line.startswith(level_prefix(99)))
+
+
+def test_find_key_compares_numerically():
+    tree = AVLTree()
+    for k in range(20):
+        tree.insert(k)
+    pager, text = make_pager(tree)
+    assert pager.find(lambda line: line_has_key(line, 3.0))
+    assert line_has_key(text.content.splitlines()[0], 3)
+    assert not pager.find(lambda line: line_has_key(line, 3.5))
+    big = 2**53 + 1
+    tree.insert(big)
+    pager, text = make_pager(tree)
+    assert pager.find(lambda line: line_has_key(line, big))
+    assert not pager.find(lambda line: line_has_key(line, big + 1))
+
+
+def test_next_page_does_not_rewalk_source():
+    calls, pulled = [], []
+
+    def source():
+        calls.append(1)
+        for i in range(100):
+            pulled.append(i)
+            yield str(i)
+
+    text = FakeText()
+    pager = PagedOutput(text, FakeText(), 10)
+    pager.show("Teste", source)
+    for _ in range(4):
+        pager.next_page()
+    assert text.content.splitlines() == [str(i) for i in range(40, 50)]
+    assert len(calls) == 1
+    assert len(pulled) == 50
+    pager.prev_page()
+    assert text.content.splitlines() == [str(i) for i in range(30, 40)]
+    assert len(calls) == 2